@@ -5,16 +5,23 @@ Recovers deleted files and files from formatted/corrupted drives
 Works on Kali Linux and Windows
 """
 
+import io
 import os
+import re
 import sys
-import argparse
+import queue
+import threading
 import logging
+import mmap
+import stat
 import struct
 import zlib
-import hashlib
+import importlib.util
 from pathlib import Path
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import count, islice
 import tqdm
 import pytsk3
 
@@ -26,6 +33,36 @@ except ImportError:
     HAS_EWF = False
     print("Warning: pyewf not available. EWF file support disabled.")
 
+# Optional accelerators for signature scanning (regex fallback is used otherwise)
+try:
+    import hyperscan
+    HAS_HYPERSCAN = True
+except ImportError:
+    HAS_HYPERSCAN = False
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# Numba takes longer to import than everything else together, so it is only imported once a scanner needs it
+HAS_NUMBA = HAS_NUMPY and importlib.util.find_spec('numba') is not None
+
+# Optional faster hash for duplicate detection (SHA-256 is used otherwise)
+try:
+    import blake3
+    HAS_BLAKE3 = True
+except ImportError:
+    HAS_BLAKE3 = False
+
+# Optional io_uring bindings for reading devices with several requests in flight (Linux only)
+try:
+    import liburing
+    HAS_LIBURING = True
+except ImportError:
+    HAS_LIBURING = False
+
 # Supported file signatures with proper handling for duplicates
 FILE_SIGNATURES = [
     # Documents
@@ -44,7 +81,7 @@ FILE_SIGNATURES = [
     (b'\x4D\x4D\x00\x2A', 0, 'tiff', 100000000),  # Big-endian
     
     # Video
-    (b'\x00\x00\x00\x18\x66\x74\x79\x70', 4, 'mp4', 500000000),  # MP4
+    (b'\x00\x00\x00\x18\x66\x74\x79\x70', 0, 'mp4', 500000000),  # MP4
     (b'\x52\x49\x46\x46', 0, 'avi', 500000000),   # AVI/RIFF
     (b'\x1A\x45\xDF\xA3', 0, 'mkv', 500000000),   # Matroska
     (b'\x66\x74\x79\x70', 4, 'mov', 500000000),   # QuickTime
@@ -97,6 +134,506 @@ EXTENSION_MAP = {
     'exe': '.exe'
 }
 
+def group_signatures(signatures):
+    """Group signature entries sharing the same bytes (e.g. RIFF for AVI and WAV), keeping table order"""
+    groups = defaultdict(list)
+    for signature, offset, file_type, max_size in signatures:
+        groups[signature].append((offset, file_type, max_size))
+    return [(signature, tuple(entries)) for signature, entries in groups.items()]
+
+# Signatures can only straddle a window edge by this much, whichever subset is scanned
+MAX_SIGNATURE_LEN = max(len(signature) for signature, _, _, _ in FILE_SIGNATURES)
+
+def build_signature_database(groups):
+    """Compile all signatures into a Hyperscan block-mode database
+
+    Hyperscan selects the fastest code path (AVX-512, AVX2, SSSE3) for the CPU
+    at run time. Every byte is written as a \\xHH escape because the binding's
+    pure literal mode passes patterns as C strings, cutting them at NUL bytes.
+    """
+    expressions = [''.join(f'\\x{byte:02x}' for byte in signature).encode() for signature, _ in groups]
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    database.compile(expressions=expressions, ids=list(range(len(groups))), elements=len(groups), flags=0)
+    return database
+
+def build_signature_arrays(groups):
+    """Lay out signature bytes as numpy arrays (structure of arrays) for the vectorized scanners
+
+    Returns a zero-padded byte matrix with one row per signature, the signature
+    lengths, and a first-byte index: the signatures starting with byte b are
+    by_first[first_start[b]:first_start[b + 1]].
+    """
+    sig_matrix = np.zeros((len(groups), MAX_SIGNATURE_LEN), dtype=np.uint8)
+    lengths = np.zeros(len(groups), dtype=np.int64)
+    for index, (signature, _) in enumerate(groups):
+        sig_matrix[index, :len(signature)] = np.frombuffer(signature, dtype=np.uint8)
+        lengths[index] = len(signature)
+        
+    by_first = np.argsort(sig_matrix[:, 0], kind='stable').astype(np.int64)
+    first_start = np.zeros(257, dtype=np.int64)
+    first_start[1:] = np.cumsum(np.bincount(sig_matrix[:, 0], minlength=256))
+    return sig_matrix, lengths, first_start, by_first
+
+def _scan_kernel(buf, sig_matrix, lengths, first_start, by_first):
+    """Return (positions, group indexes) of every signature in buf, compiled by compile_scan_kernel()"""
+    n = buf.shape[0]
+    capacity = 1024
+    positions = np.empty(capacity, dtype=np.int64)
+    indexes = np.empty(capacity, dtype=np.int64)
+    count = 0
+    for i in range(n):
+        b = buf[i]
+        for j in range(first_start[b], first_start[b + 1]):
+            k = by_first[j]
+            sig_len = lengths[k]
+            # Check the last byte before the rest, like the numpy prefilter
+            if i + sig_len > n or buf[i + sig_len - 1] != sig_matrix[k, sig_len - 1]:
+                continue
+            matched = True
+            for m in range(1, sig_len - 1):
+                if buf[i + m] != sig_matrix[k, m]:
+                    matched = False
+                    break
+            if not matched:
+                continue
+            if count == capacity:
+                capacity *= 2
+                grown = np.empty(capacity, dtype=np.int64)
+                grown[:count] = positions[:count]
+                positions = grown
+                grown = np.empty(capacity, dtype=np.int64)
+                grown[:count] = indexes[:count]
+                indexes = grown
+            positions[count] = i
+            indexes[count] = k
+            count += 1
+    return positions[:count], indexes[:count]
+
+_compiled_scan_kernel = None
+
+def compile_scan_kernel():
+    """Return _scan_kernel compiled with Numba, importing Numba on first use; None if it cannot be imported"""
+    global _compiled_scan_kernel
+    if _compiled_scan_kernel is None:
+        try:
+            import numba
+        except ImportError:
+            return None
+        _compiled_scan_kernel = numba.njit(cache=True, nogil=True)(_scan_kernel)
+    return _compiled_scan_kernel
+
+def build_signature_pattern(groups):
+    """Compile all signatures into one regex alternation
+
+    Longer signatures come first so a signature that is a prefix of another
+    never shadows it. Capture groups are avoided on purpose: they disable the
+    regex engine's literal prefix search and make scanning ~50x slower.
+    """
+    signatures = sorted((signature for signature, _ in groups), key=len, reverse=True)
+    return re.compile(b'|'.join(re.escape(signature) for signature in signatures))
+
+def find_data_segments(buffer, block_size=64*1024):
+    """Return the (start, end) ranges of buffer worth scanning for signatures
+
+    Blocks made of one repeated byte (zeroed or wiped sectors) cannot contain
+    a signature and are left out. Ranges reach MAX_SIGNATURE_LEN - 1 bytes into
+    skipped neighbours so signatures crossing a block edge are still found.
+    """
+    view = memoryview(buffer)
+    size = len(view)
+    overlap = MAX_SIGNATURE_LEN - 1
+    segments = []
+    previous_fill = None
+    
+    for block_start in range(0, size, block_size):
+        block = view[block_start:block_start + block_size]
+        # Sample every 4KB first so most data blocks are rejected without a full compare
+        sample = bytes(block[::4096])
+        fill = sample[:1]
+        uniform = sample == fill * len(sample) and bytes(block) == fill * len(block)
+        
+        if not uniform:
+            start, end = max(0, block_start - overlap), min(size, block_start + block_size + overlap)
+            previous_fill = None
+        elif previous_fill is None or previous_fill == fill:
+            # Either continues a skipped run or was already covered by the previous range
+            previous_fill = fill
+            continue
+        else:
+            # Two different fills meet: only the boundary itself needs scanning
+            start, end = block_start - overlap, block_start + overlap
+            previous_fill = fill
+            
+        if segments and start <= segments[-1][1]:
+            segments[-1] = (segments[-1][0], end)
+        else:
+            segments.append((start, end))
+            
+    return segments
+
+# Segments are scanned in tiles of this size, so backends making several passes reread them from L2 cache
+SCAN_TILE_SIZE = 2 * 1024 * 1024
+
+class SignatureScanner:
+    """Signature matchers for a set of signatures, compiled for the fastest installed backend"""
+    def __init__(self, signatures):
+        self.groups = group_signatures(signatures)
+        self._scan = self._compile()
+        
+    def _compile(self):
+        """Build the matcher for the preferred backend and return its scan method"""
+        if HAS_HYPERSCAN:
+            try:
+                self.database = build_signature_database(self.groups)
+                return self._scan_hyperscan
+            except hyperscan.error:
+                pass  # The CPU lacks Hyperscan's minimum instruction set, use another backend
+                
+        if HAS_NUMPY:
+            self.sig_matrix, self.lengths, self.first_start, self.by_first = build_signature_arrays(self.groups)
+        if HAS_NUMBA:
+            self.kernel = compile_scan_kernel()
+            if self.kernel:
+                return self._scan_compiled
+        if HAS_NUMPY:
+            self.anchors = np.unique(self.sig_matrix[:, 0]).tolist()
+            self.last = self.sig_matrix[np.arange(len(self.lengths)), self.lengths - 1]
+            return self._scan_prefilter
+            
+        self.pattern = build_signature_pattern(self.groups)
+        self.index = {signature: index for index, (signature, _) in enumerate(self.groups)}
+        return self._scan_regex
+        
+    def scan(self, buffer):
+        """Return (start, signature group index) for every signature in buffer, ordered by start"""
+        view = memoryview(buffer)
+        overlap = MAX_SIGNATURE_LEN - 1
+        hits = []
+        for start, end in find_data_segments(view):
+            for tile_start in range(start, end, SCAN_TILE_SIZE):
+                # Tiles reach into the next one so signatures crossing the edge are found, by this tile only
+                tile_end = tile_start + SCAN_TILE_SIZE
+                hits.extend((tile_start + tile_pos, index)
+                            for tile_pos, index in self._scan(view[tile_start:min(end, tile_end + overlap)])
+                            if tile_start + tile_pos < tile_end)
+        return sorted(hits)
+        
+    def _scan_hyperscan(self, buffer):
+        """Find signatures with the Hyperscan database"""
+        hits = []
+        groups = self.groups
+        
+        def on_match(index, start, end, flags, context):
+            # Without start-of-match flags only the end is reported; signatures have a fixed length
+            hits.append((end - len(groups[index][0]), index))
+            
+        self.database.scan(buffer, match_event_handler=on_match)
+        return hits
+        
+    def _scan_compiled(self, buffer):
+        """Find signatures with the Numba-compiled scanner"""
+        positions, indexes = self.kernel(np.frombuffer(buffer, dtype=np.uint8),
+                                         self.sig_matrix, self.lengths, self.first_start, self.by_first)
+        return zip(positions.tolist(), indexes.tolist())
+        
+    def _scan_prefilter(self, buffer):
+        """Find signatures with one numpy pass per distinct first byte, then verifying candidates"""
+        arr = np.frombuffer(buffer, dtype=np.uint8)
+        for first in self.anchors:
+            # Signatures sharing a first byte reuse the same candidate positions
+            positions = np.flatnonzero(arr == first)
+            if not len(positions):
+                continue
+            for index in self.by_first[self.first_start[first]:self.first_start[first + 1]].tolist():
+                sig_len = self.lengths[index]
+                candidates = positions[positions <= len(arr) - sig_len]
+                candidates = candidates[arr[candidates + sig_len - 1] == self.last[index]]
+                if sig_len > 2 and len(candidates):
+                    # Compare the middle bytes of all candidates at once
+                    middle = arr[candidates[:, None] + np.arange(1, sig_len - 1)]
+                    candidates = candidates[(middle == self.sig_matrix[index, 1:sig_len - 1]).all(axis=1)]
+                for start in candidates.tolist():
+                    yield start, index
+                    
+    def _scan_regex(self, buffer):
+        """Find signatures with the compiled regex alternation"""
+        # search() from one past each hit instead of finditer() so overlapping matches are kept
+        search = self.pattern.search
+        match = search(buffer)
+        while match:
+            start = match.start()
+            yield start, self.index[bytes(match.group())]
+            match = search(buffer, start + 1)
+            
+# Compiled scanners by file type set, so repeated runs and worker tasks reuse them
+_SIGNATURE_SCANNERS = {}
+
+def get_signature_scanner(file_types=None):
+    """Return the scanner for the signatures of file_types (all types when None), compiling it on first use"""
+    key = None if file_types is None else frozenset(file_types)
+    scanner = _SIGNATURE_SCANNERS.get(key)
+    if scanner is None:
+        signatures = [entry for entry in FILE_SIGNATURES if key is None or entry[2] in key]
+        scanner = _SIGNATURE_SCANNERS[key] = SignatureScanner(signatures)
+    return scanner
+
+def carve_types_for_filters(filters):
+    """Return the file types whose carved extension can pass the extension filter, or None for all"""
+    if not filters or not filters.get('extensions'):
+        return None
+    return frozenset(file_type for _, _, file_type, _ in FILE_SIGNATURES
+                     if EXTENSION_MAP.get(file_type, '.bin') in filters['extensions'])
+
+# Inputs from this size on are hashed by BLAKE3 on all cores, below it the thread setup costs more than it saves
+THREADED_HASH_SIZE = 1024 * 1024
+
+def new_content_hasher(threaded=False):
+    """Return a hasher for duplicate detection: SIMD BLAKE3 when installed, SHA-256 otherwise"""
+    if not HAS_BLAKE3:
+        import hashlib
+        return hashlib.sha256()
+    return blake3.blake3(max_threads=blake3.blake3.AUTO) if threaded else blake3.blake3()
+
+def content_digest(data):
+    """Hash carved data for duplicate detection"""
+    hasher = new_content_hasher(threaded=len(data) >= THREADED_HASH_SIZE)
+    hasher.update(data)
+    return hasher.digest()
+
+def file_content_digest(path, chunk_size=16*1024*1024):
+    """Hash a saved file in chunks, so large files are never fully loaded"""
+    hasher = new_content_hasher(threaded=True)
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with open(path, 'rb', buffering=0) as f:
+        # Read into one reused buffer instead of allocating every chunk
+        while True:
+            data_len = f.readinto(buffer)
+            if not data_len:
+                break
+            hasher.update(view[:data_len])
+    return hasher.digest()
+
+def drop_cached(fd, start, length, source_map=None):
+    """Evict a finished region of the source from the page cache, it is not read again"""
+    try:
+        if source_map is not None and hasattr(mmap, 'MADV_DONTNEED') and not start % mmap.PAGESIZE:
+            # Mapped pages stay cached while this process maps them
+            source_map.madvise(mmap.MADV_DONTNEED, start, min(length, len(source_map) - start))
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, start, length, os.POSIX_FADV_DONTNEED)
+    except (OSError, ValueError):
+        pass
+
+def chunk_windows(read_chunk, start, end, chunk_size, lead=b'', read_ahead=False, depth=2):
+    """Yield (start, buffer, tail length) windows over [start, end) filled by read_chunk(view, position, read_size)
+
+    lead holds the bytes just before start, so the first window also catches
+    signatures crossing start. With read_ahead, a thread fills the next of
+    `depth` rotating buffers while the caller scans and carves the current
+    one; the read releases the GIL, so I/O and scanning overlap.
+    """
+    # Keep enough of the previous chunk to catch signatures crossing a chunk boundary
+    overlap = MAX_SIGNATURE_LEN - 1
+    # Chunks are read in after a one page head holding that overlap, so they stay page aligned for O_DIRECT
+    head = mmap.PAGESIZE
+    buffers = [mmap.mmap(-1, head + chunk_size) for _ in range(depth if read_ahead else 1)]
+    free = queue.Queue()
+    for index in range(len(buffers)):
+        free.put(index)
+    filled = queue.Queue()
+    stop = threading.Event()
+    
+    def fill(position):
+        index = free.get()
+        if index is None:
+            return None, 0
+        # The view spans the whole chunk area, direct reads round their length up to whole pages
+        return index, read_chunk(memoryview(buffers[index])[head:], position, min(chunk_size, end - position))
+        
+    def read_loop():
+        position = start
+        try:
+            while position < end and not stop.is_set():
+                index, data_len = fill(position)
+                filled.put((index, data_len))
+                if not data_len:
+                    return
+                position += data_len
+            filled.put((None, 0))
+        except Exception as e:
+            filled.put((None, e))
+            
+    thread = None
+    if read_ahead:
+        thread = threading.Thread(target=read_loop, name="chunk-reader", daemon=True)
+        thread.start()
+        
+    position = start
+    tail_len = len(lead)
+    previous = None
+    try:
+        while position < end:
+            index, data_len = filled.get() if thread else fill(position)
+            if isinstance(data_len, Exception):
+                raise data_len
+            if not data_len:
+                break
+                
+            # Move the end of the previous window into this buffer's head, then hand its buffer back
+            buffer = buffers[index]
+            if previous is not None:
+                previous_index, previous_len = previous
+                buffer[head - tail_len:head] = buffers[previous_index][head + previous_len - tail_len:head + previous_len]
+                free.put(previous_index)
+                previous = None
+            elif position == start:
+                # The first window starts with the bytes before the range
+                buffer[head - tail_len:head] = lead
+                
+            yield position - tail_len, memoryview(buffer)[head - tail_len:head + data_len], tail_len
+            
+            tail_len = min(overlap, tail_len + data_len)
+            if thread:
+                # The next chunk is already being read into the other buffer, copy the tail once it arrives
+                previous = (index, data_len)
+            else:
+                buffer[head - tail_len:head] = buffer[head + data_len - tail_len:head + data_len]
+                free.put(index)
+            position += data_len
+    finally:
+        if thread:
+            stop.set()
+            free.put(None)  # Wake the reader if it waits for a buffer
+            thread.join()
+
+def open_direct(file_handle, chunk_size):
+    """Open a block device again with O_DIRECT so scanning bypasses the page cache, or return None"""
+    # Direct reads need page-aligned offsets and lengths, so chunk_size must be a page multiple
+    if not hasattr(os, 'O_DIRECT') or not isinstance(file_handle, io.FileIO) or chunk_size % mmap.PAGESIZE:
+        return None
+    try:
+        if not stat.S_ISBLK(os.fstat(file_handle.fileno()).st_mode):
+            return None
+        return os.open(file_handle.name, os.O_RDONLY | os.O_DIRECT)
+    except OSError as e:
+        # Not supported by this device or driver, stay on buffered reads
+        logging.debug(f"O_DIRECT unavailable, using buffered reads: {e}")
+        return None
+        
+def read_direct(fd, view, read_size, position):
+    """Read read_size bytes at position through an O_DIRECT descriptor into a page-aligned view"""
+    # Round the length up to whole pages; the device end cuts the last read short
+    aligned_size = -(-read_size // mmap.PAGESIZE) * mmap.PAGESIZE
+    return min(os.preadv(fd, [view[:aligned_size]], position), read_size)
+    
+def open_uring_reader(file_handle, start, end, depth=8, block_size=4*1024*1024):
+    """Return an io_uring reader over [start, end) of a raw file handle, or None to use plain reads"""
+    if not HAS_LIBURING or not isinstance(file_handle, io.FileIO):
+        return None
+    try:
+        return UringReader(file_handle.fileno(), end, block_size=block_size, depth=depth, start=start)
+    except OSError as e:
+        # Kernels before 5.1, or io_uring disabled by sysctl or seccomp
+        logging.debug(f"io_uring unavailable, using plain reads: {e}")
+        return None
+        
+def read_into(file_handle, view):
+    """Read into a preallocated buffer, for handles without readinto() such as pyewf"""
+    if hasattr(file_handle, 'readinto'):
+        return file_handle.readinto(view)
+    data = file_handle.read(len(view))
+    view[:len(data)] = data
+    return len(data)
+    
+def read_source_windows(file_handle, start, end, chunk_size, reader_depth=8, read_ahead=True,
+                        reader_block_size=4*1024*1024):
+    """Yield (start, buffer, tail length) windows over [start, end) of a handle, read into reused buffers
+
+    Block devices are read through an O_DIRECT descriptor, other raw files
+    through io_uring or positional reads, and other handles (pyewf) by seeking.
+    Positional reads are done on a read-ahead thread unless read_ahead is
+    False. Each window is dropped from the page cache once the caller resumes.
+    """
+    direct_fd = open_direct(file_handle, chunk_size)
+    reader = None
+    if direct_fd is None:
+        reader = open_uring_reader(file_handle, start, end, reader_depth, reader_block_size)
+    # Positional reads leave the handle's offset alone, so a thread can read ahead while carving seeks it
+    positional = isinstance(file_handle, io.FileIO) and hasattr(os, 'preadv')
+    
+    # Read the bytes before start as well, so signatures crossing it are found
+    lead_start = max(0, start - (MAX_SIGNATURE_LEN - 1))
+    lead = bytearray(start - lead_start)
+    if lead:
+        file_handle.seek(lead_start)
+        del lead[read_into(file_handle, memoryview(lead)):]
+        
+    def read_chunk(view, position, read_size):
+        nonlocal direct_fd, reader
+        if direct_fd is not None:
+            try:
+                return read_direct(direct_fd, view, read_size, position)
+            except OSError as e:
+                logging.warning(f"Direct read failed at offset {position}, using buffered reads: {e}")
+                os.close(direct_fd)
+                direct_fd = None
+        view = view[:read_size]
+        if reader:
+            try:
+                return reader.readinto(view)
+            except OSError as e:
+                logging.warning(f"io_uring read failed at offset {position}, using plain reads: {e}")
+                reader.close()
+                reader = None
+        if positional:
+            return os.preadv(file_handle.fileno(), [view], position)
+        # Read chunk (carving moves the handle, so seek back first)
+        file_handle.seek(position)
+        return read_into(file_handle, view)
+        
+    try:
+        # io_uring already keeps reads in flight on its own
+        for window in chunk_windows(read_chunk, start, end, chunk_size, bytes(lead),
+                                    read_ahead=read_ahead and positional and not reader):
+            yield window
+            # Resumed once the window has been scanned, and carved when the caller carves as it goes
+            if isinstance(file_handle, io.FileIO):
+                window_start, buffer, tail_len = window
+                drop_cached(file_handle.fileno(), window_start + tail_len, len(buffer) - tail_len)
+    finally:
+        if direct_fd is not None:
+            os.close(direct_fd)
+        if reader:
+            reader.close()
+            
+def scan_source_range(source_path, start, end, chunk_size, file_types=None, reader_depth=8,
+                      reader_block_size=4*1024*1024):
+    """Scan source_path[start:end] for signatures of file_types in a worker process
+
+    The range is read like the serial path reads a device, chunk_size bytes
+    at a time (see read_source_windows); returns absolute (position, group
+    index) hits, including signatures crossing start. reader_depth is the
+    number of io_uring reads of reader_block_size bytes this worker keeps in
+    flight. Workers do not read
+    ahead: they already overlap their reads with each other, and a second
+    buffer per worker would double their memory.
+    """
+    scanner = get_signature_scanner(file_types)
+    hits = []
+    with open(source_path, 'rb', buffering=0) as f:
+        if hasattr(os, 'posix_fadvise'):
+            try:
+                os.posix_fadvise(f.fileno(), start, end - start, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass
+        windows = read_source_windows(f, start, end, chunk_size, reader_depth, read_ahead=False,
+                                      reader_block_size=reader_block_size)
+        for window_start, buffer, tail_len in windows:
+            hits.extend((window_start + buffer_pos, index) for buffer_pos, index in scanner.scan(buffer)
+                        if buffer_pos + len(scanner.groups[index][0]) > tail_len)
+    return hits
+
 class EWFImgInfo(pytsk3.Img_Info):
     """Wrapper for EWF files to work with pytsk3"""
     def __init__(self, ewf_handle):
@@ -113,10 +650,289 @@ class EWFImgInfo(pytsk3.Img_Info):
     def get_size(self):
         return self._ewf_handle.get_media_size()
 
+class HandleView:
+    """Read-only, mmap-like view over a seekable handle (devices and EWF images)
+
+    Implements the part of the mmap API the carvers use: len(), slicing and find().
+    """
+    def __init__(self, file_handle, size, block_size=4*1024*1024):
+        self._handle = file_handle
+        self._size = size
+        self._block_size = block_size
+        
+    def __len__(self):
+        return self._size
+        
+    def __getitem__(self, key):
+        start, stop, _ = key.indices(self._size)
+        data = bytearray()
+        self._handle.seek(start)
+        while start + len(data) < stop:
+            block = self._handle.read(stop - start - len(data))
+            if not block:
+                break
+            data += block
+        return bytes(data)
+        
+    def find(self, sub, start=0, end=None):
+        end = self._size if end is None else min(end, self._size)
+        # Blocks overlap so a match straddling two blocks is still found
+        overlap = len(sub) - 1
+        pos = start
+        while pos < end:
+            block = self[pos:min(pos + self._block_size + overlap, end)]
+            found = block.find(sub)
+            if found != -1:
+                return pos + found
+            pos += self._block_size
+        return -1
+
+class UringReader:
+    """Sequential reader keeping several io_uring reads in flight (Linux)
+
+    Blocks are read into `depth` rotating buffers, so the device keeps
+    working on the next blocks while the current one is copied out and
+    scanned. readinto() mirrors the file object method, reading from start
+    up to size.
+    """
+    def __init__(self, fd, size, block_size=4*1024*1024, depth=8, start=0):
+        self._fd = fd
+        self._start = start
+        self._size = size
+        self._block_size = block_size
+        self._depth = depth
+        self._ring = liburing.Ring()
+        self._cqe = liburing.Cqe()
+        liburing.io_uring_queue_init(depth, self._ring)
+        self._buffers = [bytearray(block_size) for _ in range(depth)]
+        self._iovecs = self._register_buffers()
+        self._files = self._register_file()
+        self._completed = {}
+        self._in_flight = 0
+        self._submitted = 0  # Blocks submitted so far
+        self._consumed = 0   # Blocks handed out so far
+        self._current = memoryview(b'')
+        
+    def _register_buffers(self):
+        """Pin the buffers once so reads skip pinning them each time, or return None to use plain reads"""
+        try:
+            iovecs = liburing.Iovec(self._buffers)
+            liburing.io_uring_register_buffers(self._ring, iovecs)
+            return iovecs  # The kernel keeps pointing at them, hold a reference until the ring is released
+        except OSError as e:
+            # Kernels before 5.19 charge pinned buffers to RLIMIT_MEMLOCK, often only a few MB
+            logging.debug(f"Could not register io_uring buffers: {e}")
+            return None
+            
+    def _register_file(self):
+        """Register the source descriptor so submissions skip the fd table lookup, or return None"""
+        try:
+            files = liburing.FileIndex([self._fd])
+            liburing.io_uring_register_files(self._ring, files)
+            return files
+        except OSError as e:
+            logging.debug(f"Could not register io_uring file: {e}")
+            return None
+            
+    def readinto(self, view):
+        """Copy the next bytes of the source into view, returning how many were copied"""
+        copied = 0
+        while copied < len(view):
+            if not self._current:
+                self._current = self._next_block()
+                if not self._current:
+                    break
+            size = min(len(self._current), len(view) - copied)
+            view[copied:copied + size] = self._current[:size]
+            self._current = self._current[size:]
+            copied += size
+        return copied
+        
+    def _next_block(self):
+        """Wait for the next block in source order and return a view of its data"""
+        # The previous block has been copied out, so its buffer can take a new read
+        self._submit()
+        offset = self._start + self._consumed * self._block_size
+        if offset >= self._size:
+            return memoryview(b'')
+            
+        slot = self._consumed % self._depth
+        while slot not in self._completed:
+            liburing.io_uring_wait_cqe(self._ring, self._cqe)
+            try:
+                entry = self._cqe[0]
+            except OSError:
+                # Failed reads only report errno, mark them seen before raising
+                liburing.io_uring_cq_advance(self._ring, 1)
+                self._in_flight -= 1
+                raise
+            self._completed[entry.user_data] = entry.res
+            liburing.io_uring_cqe_seen(self._ring, entry)
+            self._in_flight -= 1
+            
+        # Reads ask for a whole buffer, the last block may only be partly inside the source
+        length = min(self._block_size, self._size - offset)
+        data_len = min(self._completed.pop(slot), length)
+        view = memoryview(self._buffers[slot])
+        # Finish short reads synchronously
+        while data_len < length:
+            read_size = os.preadv(self._fd, [view[data_len:length]], offset + data_len)
+            if not read_size:
+                break
+            data_len += read_size
+            
+        self._consumed += 1
+        return view[:data_len]
+        
+    def _submit(self):
+        """Queue reads until depth blocks are ahead of the consumer or the source is covered"""
+        queued = 0
+        while (self._submitted < self._consumed + self._depth
+               and self._start + self._submitted * self._block_size < self._size):
+            sqe = liburing.io_uring_get_sqe(self._ring)
+            slot = self._submitted % self._depth
+            offset = self._start + self._submitted * self._block_size
+            # A registered file is addressed by its index in the registered set
+            fd = 0 if self._files else self._fd
+            if self._iovecs:
+                liburing.io_uring_prep_read_fixed(sqe, fd, self._buffers[slot], slot, offset)
+            else:
+                liburing.io_uring_prep_read(sqe, fd, self._buffers[slot], offset)
+            if self._files:
+                sqe.flags |= liburing.IOSQE_FIXED_FILE
+            liburing.io_uring_sqe_set_data64(sqe, slot)
+            self._submitted += 1
+            queued += 1
+        if queued:
+            liburing.io_uring_submit(self._ring)
+            self._in_flight += queued
+            
+    def close(self):
+        """Wait for reads still in flight, then release the ring"""
+        # The kernel writes into the buffers until each read completes
+        while self._in_flight:
+            liburing.io_uring_wait_cqe(self._ring, self._cqe)
+            liburing.io_uring_cq_advance(self._ring, 1)
+            self._in_flight -= 1
+        liburing.io_uring_queue_exit(self._ring)
+        
+class UringWriter:
+    """Write small files through io_uring, handing a batch of writes to the kernel in one system call (Linux)
+
+    write() queues a whole-file write and takes over the descriptor; flush()
+    waits for the batch, finishes short or failed writes with pwrite and
+    closes the descriptors.
+    """
+    def __init__(self, depth=32, max_pending_bytes=32*1024*1024):
+        self._depth = depth
+        self._max_pending_bytes = max_pending_bytes
+        self._ring = liburing.Ring()
+        self._cqe = liburing.Cqe()
+        liburing.io_uring_queue_init(depth, self._ring)
+        self._pending = []
+        self._pending_bytes = 0
+        
+    def write(self, fd, data):
+        """Queue writing data to a new file's descriptor, which is closed once the batch is flushed"""
+        if len(self._pending) == self._depth or self._pending_bytes + len(data) > self._max_pending_bytes:
+            self.flush()
+        sqe = liburing.io_uring_get_sqe(self._ring)
+        liburing.io_uring_prep_write(sqe, fd, data, 0)
+        liburing.io_uring_sqe_set_data64(sqe, len(self._pending))
+        self._pending.append((fd, data))
+        self._pending_bytes += len(data)
+        
+    def flush(self):
+        """Submit the queued writes with one system call, wait for them and close their descriptors"""
+        if not self._pending:
+            return
+        written = [0] * len(self._pending)
+        try:
+            liburing.io_uring_submit(self._ring)
+            for _ in range(len(self._pending)):
+                liburing.io_uring_wait_cqe(self._ring, self._cqe)
+                try:
+                    entry = self._cqe[0]
+                except OSError:
+                    # Failed writes only report errno; they are redone below, raising there if they fail again
+                    liburing.io_uring_cq_advance(self._ring, 1)
+                    continue
+                written[entry.user_data] = entry.res
+                liburing.io_uring_cqe_seen(self._ring, entry)
+                
+            for (fd, data), done in zip(self._pending, written):
+                view = memoryview(data)[done:]
+                while view:
+                    view = view[os.pwrite(fd, view, len(data) - len(view)):]
+        finally:
+            for fd, _ in self._pending:
+                os.close(fd)
+            self._pending = []
+            self._pending_bytes = 0
+            
+    def close(self):
+        """Flush queued writes and release the ring"""
+        try:
+            self.flush()
+        finally:
+            liburing.io_uring_queue_exit(self._ring)
+            
+class BufferedFileHandler(logging.FileHandler):
+    """Log file handler that flushes once per interval instead of after every record"""
+    
+    def __init__(self, filename, flush_interval=1.0, buffer_size=1024*1024):
+        self.flush_interval = flush_interval
+        self.buffer_size = buffer_size
+        super().__init__(filename)
+        # Flush from a timer so records are written even when no later record arrives
+        self._stopped = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, name="log-flush", daemon=True)
+        self._flusher.start()
+        if hasattr(os, 'register_at_fork'):
+            # Forked scan workers would otherwise write out their own copy of the buffer
+            os.register_at_fork(before=self.flush)
+        
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+                    
+    def _flush_loop(self):
+        while not self._stopped.wait(self.flush_interval):
+            self.flush()
+            
+    def emit(self, record):
+        """Append a record to the buffer, writing warnings out immediately"""
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            # StreamHandler.emit() would flush, costing one write() per carved file
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+            
+    def close(self):
+        self._stopped.set()
+        super().close()
+            
 class FileRecoveryTool:
+    # Files below this size are written through the batched writer, larger ones with O_DIRECT
+    BATCHED_WRITE_LIMIT = 1024 * 1024
+    # Carving chunk sizes: large sequential reads suit disks and images, deep-queue SSDs do better with small ones
+    DEFAULT_CHUNK_SIZE = 64 * 1024 * 1024
+    SSD_CHUNK_SIZE = 16 * 1024 * 1024
+    NVME_CHUNK_SIZE = 4 * 1024 * 1024
+    
     def __init__(self):
         self.output_dir = None
         self.log_file = None
+        # (size, prefix) of carved files -> path of the first carve, or the set of content digests
+        self._carved_index = {}
+        # Batched io_uring writer, open while a recovery runs
+        self._writer = None
+        # Descriptor of the image file being carved, large carves are copied from it in the kernel
+        self._copy_source = None
         self.setup_logging()
         
     def setup_logging(self):
@@ -126,11 +942,13 @@ class FileRecoveryTool:
         self.output_dir.mkdir(exist_ok=True)
         
         self.log_file = self.output_dir / "recovery.log"
-        logging.basicConfig(
-            filename=str(self.log_file),
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s'
-        )
+        # basicConfig() is a no-op once configured, so only open the file when it will be used
+        if not logging.getLogger().handlers:
+            logging.basicConfig(
+                handlers=[BufferedFileHandler(str(self.log_file))],
+                level=logging.INFO,
+                format='%(asctime)s - %(levelname)s - %(message)s'
+            )
         console = logging.StreamHandler()
         console.setLevel(logging.INFO)
         formatter = logging.Formatter('%(levelname)s: %(message)s')
@@ -169,27 +987,84 @@ class FileRecoveryTool:
             logging.error(f"Error accessing filesystem: {e}")
             return None, None
             
-    def walk_directory(self, directory, recursive=True):
-        """Recursively walk through directory and yield files"""
-        try:
-            for fs_object in directory:
-                if fs_object.info.name.name in [b".", b".."]:
-                    continue
-                    
-                if hasattr(fs_object.info.meta, 'type'):
-                    if fs_object.info.meta.type == pytsk3.TSK_FS_META_TYPE_DIR:
-                        if recursive:
-                            try:
-                                subdir = fs_object.as_directory()
-                                yield from self.walk_directory(subdir, recursive)
-                            except Exception as e:
-                                logging.warning(f"Error accessing subdirectory: {e}")
-                                continue
-                    elif fs_object.info.meta.type == pytsk3.TSK_FS_META_TYPE_REG:
-                        yield fs_object
-        except Exception as e:
-            logging.warning(f"Error walking directory: {e}")
+    def walk_directory(self, directory, recursive=True, max_workers=None, max_pending_dirs=64, include=None):
+        """Walk through directory with a thread pool and yield regular files
+
+        Files are yielded in the order of a recursive depth-first walk, so the
+        names they are recovered under do not depend on thread timing. Worker
+        threads list up to max_pending_dirs subdirectories ahead of the walk,
+        which bounds memory; the others are listed when the walk reaches them.
+        When given, include(fs_object, meta) is checked before a file is listed.
+        """
+        stop = threading.Event()
+        
+        def list_directory(directory):
+            # (fs_object, None) for files and (fs_object, [listing future]) for subdirectories, in directory order
+            entries = []
+            try:
+                for fs_object in directory:
+                    if stop.is_set():
+                        break
+                    # Every attribute access builds a new wrapper object, so look each one up once
+                    info = fs_object.info
+                    if info.name.name in (b".", b".."):
+                        continue
+                        
+                    meta = info.meta
+                    if hasattr(meta, 'type'):
+                        if meta.type == pytsk3.TSK_FS_META_TYPE_DIR:
+                            if recursive:
+                                entries.append((fs_object, [None]))
+                        elif meta.type == pytsk3.TSK_FS_META_TYPE_REG:
+                            if include is None or include(fs_object, meta):
+                                entries.append((fs_object, None))
+            except Exception as e:
+                logging.warning(f"Error walking directory: {e}")
+            return entries
+            
+        def list_subdirectory(fs_object):
+            try:
+                subdir = fs_object.as_directory()
+            except Exception as e:
+                logging.warning(f"Error accessing subdirectory: {e}")
+                return []
+            return list_directory(subdir)
             
+        with ThreadPoolExecutor(max_workers=max_workers or (os.cpu_count() or 1) * 2) as executor:
+            unlisted = deque()  # Subdirectories seen but not submitted yet, in the order they were seen
+            ahead = 0  # Listings submitted to the pool and not reached by the walk yet
+            
+            def descend(entries):
+                nonlocal ahead
+                unlisted.extend(entry for entry in entries if entry[1] is not None)
+                while unlisted and ahead < max_pending_dirs:
+                    fs_object, slot = unlisted.popleft()
+                    if slot[0] is None:  # Skip directories the walk already listed itself
+                        slot[0] = executor.submit(list_subdirectory, fs_object)
+                        ahead += 1
+                return iter(entries)
+                
+            stack = [descend(list_directory(directory))]
+            try:
+                while stack:
+                    entry = next(stack[-1], None)
+                    if entry is None:
+                        stack.pop()
+                        continue
+                    fs_object, slot = entry
+                    if slot is None:
+                        yield fs_object
+                    elif slot[0] is None:
+                        # Reached before the pool got to it
+                        slot[0] = False
+                        stack.append(descend(list_subdirectory(fs_object)))
+                    else:
+                        entries = slot[0].result()
+                        ahead -= 1
+                        stack.append(descend(entries))
+            finally:
+                stop.set()
+                
     def recover_deleted_files(self, source_path, filters=None, recursive=True):
         """Recover deleted files using filesystem metadata"""
         logging.info(f"Starting deleted file recovery from {source_path}")
@@ -206,47 +1081,59 @@ class FileRecoveryTool:
         output_subdir.mkdir(exist_ok=True)
         
         recovered_count = 0
+        self._writer = self._open_uring_writer()
         
         try:
             # Walk through the filesystem recursively
             root_dir = fs_info.open_dir(path="/")
             
-            for fs_object in tqdm.tqdm(self.walk_directory(root_dir, recursive), 
-                                 desc="Scanning filesystem", unit="files"):
-                # Check if file is deleted
-                if hasattr(fs_object.info.meta, 'flags') and \
-                   fs_object.info.meta.flags & pytsk3.TSK_FS_META_FLAG_UNALLOC:
-                    
-                    try:
-                        file_name = fs_object.info.name.name.decode('utf-8', errors='replace')
-                        file_size = fs_object.info.meta.size
+            # Only deleted files are queued by the walker threads
+            def is_deleted(fs_object, meta):
+                return hasattr(meta, 'flags') and meta.flags & pytsk3.TSK_FS_META_FLAG_UNALLOC
+                
+            keep = self._compile_filters(filters)
+            
+            # Repaint at most twice a second; checking the clock per file adds up on large volumes
+            for fs_object in tqdm.tqdm(self.walk_directory(root_dir, recursive, include=is_deleted), 
+                                 desc="Scanning filesystem", unit="files",
+                                 mininterval=0.5, miniters=1000):
+                try:
+                    info = fs_object.info
+                    file_name = info.name.name.decode('utf-8', errors='replace')
+                    # Name filters need no metadata, check them before touching meta
+                    if not keep(file_name, 0):
+                        continue
                         
-                        # Get file metadata
-                        mtime = fs_object.info.meta.mtime
-                        if mtime:
-                            timestamp = datetime.utcfromtimestamp(mtime).strftime('%Y%m%d_%H%M%S')
-                        else:
-                            timestamp = "unknown_time"
-                            
-                        # Apply filters if provided
-                        if filters and not self._passes_filters(file_name, file_size, filters):
-                            continue
-                            
-                        # Create unique filename with metadata
-                        base_name = f"{timestamp}_{file_size}_{file_name}"
-                        safe_name = "".join(c for c in base_name if c.isalnum() or c in '._- ').rstrip()
-                        if not safe_name:
-                            safe_name = f"file_{recovered_count:06d}"
-                            
-                        # Recover the file
-                        if self._recover_file(fs_object, output_subdir, safe_name, file_size):
-                            recovered_count += 1
-                            logging.info(f"Recovered: {file_name} ({file_size} bytes)")
-                            
-                    except Exception as e:
-                        logging.warning(f"Error processing file: {e}")
+                    meta = info.meta
+                    file_size = meta.size
+                    
+                    # Apply filters if provided
+                    if not keep(file_name, file_size):
                         continue
                         
+                    # Get file metadata, only for files that will be recovered
+                    mtime = meta.mtime
+                    if mtime:
+                        timestamp = datetime.utcfromtimestamp(mtime).strftime('%Y%m%d_%H%M%S')
+                    else:
+                        timestamp = "unknown_time"
+                        
+                    # Create unique filename with metadata
+                    base_name = f"{timestamp}_{file_size}_{file_name}"
+                    safe_name = "".join(c for c in base_name if c.isalnum() or c in '._- ').rstrip()
+                    if not safe_name:
+                        safe_name = f"file_{recovered_count:06d}"
+                        
+                    # Recover the file
+                    if self._recover_file(fs_object, output_subdir, safe_name, file_size):
+                        recovered_count += 1
+                        logging.info(f"Recovered: {file_name} ({file_size} bytes)")
+                        
+                except Exception as e:
+                    logging.warning(f"Error processing file: {e}")
+                    continue
+                    
+            self._close_writer()
             logging.info(f"Deleted file recovery completed. Recovered {recovered_count} files.")
             return True
             
@@ -255,37 +1142,79 @@ class FileRecoveryTool:
             return False
         finally:
             try:
+                self._close_writer()
                 if img_info:
                     img_info.close()
             except:
                 pass
                 
-    def recover_full_drive(self, source_path, filters=None, chunk_size=64*1024*1024):
+    def recover_full_drive(self, source_path, filters=None, chunk_size=None):
         """Recover files using file carving techniques with chunked reading"""
         logging.info(f"Starting full drive recovery from {source_path}")
         
         if not self.validate_source(source_path):
             return False
             
+        # Only scan for signatures whose carved files can pass the extension filter
+        file_types = carve_types_for_filters(filters)
+        if file_types is not None and not file_types:
+            logging.warning("No carvable file type matches the extension filter")
+            return True
+        scanner = get_signature_scanner(file_types)
+        
         # Create output subdirectory
         output_subdir = self.output_dir / "carved_files"
         output_subdir.mkdir(exist_ok=True)
         
         file_handle = None
+        source_map = None
         try:
             # Get file size and set up progress tracking
-            if HAS_EWF and source_path.lower().endswith(('.e01', '.ewf')):
+            is_ewf = HAS_EWF and source_path.lower().endswith(('.e01', '.ewf'))
+            if is_ewf:
                 filenames = pyewf.glob(source_path)
                 ewf_handle = pyewf.handle()
                 ewf_handle.open(filenames)
                 file_size = ewf_handle.get_media_size()
                 file_handle = ewf_handle
             else:
-                file_size = os.path.getsize(source_path)
-                file_handle = open(source_path, 'rb')
+                file_handle = open(source_path, 'rb', buffering=0)
+                # os.path.getsize() reports 0 for block devices, so ask the handle instead
+                file_size = file_handle.seek(0, os.SEEK_END)
+                # The source is read front to back once, so ask for aggressive readahead
+                if hasattr(os, 'posix_fadvise'):
+                    try:
+                        os.posix_fadvise(file_handle.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    except OSError:
+                        pass
+                        
+            if not chunk_size:
+                chunk_size = self._default_chunk_size(file_handle)
+                logging.info(f"Using {chunk_size // (1024 * 1024)}MB chunks")
+                
+            if file_size and os.path.isfile(source_path):
+                # Map image files so windows can be scanned and carved without copying
+                source_map = mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    # posix_fadvise() does not cover page faults on the mapping
+                    source_map.madvise(mmap.MADV_SEQUENTIAL)
+                source = source_map
+                windows = self._mmap_windows(source_map, chunk_size, file_handle.fileno())
+                self._copy_source = file_handle.fileno()
+            else:
+                # Read devices and EWF images in chunks
+                source = HandleView(file_handle, file_size)
+                windows = read_source_windows(file_handle, 0, file_size, chunk_size)
+                
+            if not is_ewf and (os.cpu_count() or 1) > 1 and file_size > chunk_size:
+                # EWF handles cannot be opened by worker processes, so only raw sources scan in parallel
+                scanned = self._scan_parallel(source_path, file_size, chunk_size, file_types)
+            else:
+                scanned = self._scan_windows(windows, scanner)
                 
-            # Scan for files in chunks
-            recovered_count = self._carve_files_chunked(file_handle, file_size, chunk_size, output_subdir, filters)
+            self._writer = self._open_uring_writer()
+            recovered_count = self._carve_hits(source, file_size, scanned, scanner.groups, output_subdir, filters)
+            self._close_writer()
             
             logging.info(f"Full drive recovery completed. Recovered {recovered_count} files.")
             return True
@@ -294,161 +1223,251 @@ class FileRecoveryTool:
             logging.error(f"Error during full drive recovery: {e}")
             return False
         finally:
+            self._copy_source = None
             try:
+                self._close_writer()
+                if source_map:
+                    source_map.close()
                 if file_handle:
                     file_handle.close()
             except:
                 pass
                 
-    def _carve_files_chunked(self, file_handle, file_size, chunk_size, output_dir, filters):
-        """Carve files from device using chunked reading"""
+    def _default_chunk_size(self, file_handle):
+        """Pick a chunk size from the block device's queue settings in sysfs"""
+        if not isinstance(file_handle, io.FileIO):
+            return self.DEFAULT_CHUNK_SIZE
+        try:
+            st = os.fstat(file_handle.fileno())
+            if not stat.S_ISBLK(st.st_mode):
+                return self.DEFAULT_CHUNK_SIZE
+            device = os.path.realpath(f"/sys/dev/block/{os.major(st.st_rdev)}:{os.minor(st.st_rdev)}")
+            # Partitions share the queue of their parent disk
+            queue_dir = os.path.join(device, "queue")
+            if not os.path.isdir(queue_dir):
+                queue_dir = os.path.join(os.path.dirname(device), "queue")
+            with open(os.path.join(queue_dir, "rotational")) as f:
+                rotational = f.read().strip() == "1"
+            with open(os.path.join(queue_dir, "nr_requests")) as f:
+                nr_requests = int(f.read())
+        except (OSError, ValueError):
+            return self.DEFAULT_CHUNK_SIZE
+        if rotational:
+            return self.DEFAULT_CHUNK_SIZE
+        # NVMe exposes deep queues (typically 1023), SATA SSDs are limited to 32 NCQ tags
+        return self.NVME_CHUNK_SIZE if nr_requests >= 256 else self.SSD_CHUNK_SIZE
+        
+    def _mmap_windows(self, source_map, chunk_size, fd=None):
+        """Yield (start, buffer, tail length) windows over a memory-mapped image without copying"""
+        view = memoryview(source_map)
+        # Keep enough of the previous chunk to catch signatures crossing a chunk boundary
+        overlap = MAX_SIGNATURE_LEN - 1
+        try:
+            for position in range(0, len(source_map), chunk_size):
+                window_start = max(0, position - overlap)
+                yield window_start, view[window_start:position + chunk_size], position - window_start
+                # Resumed once the window has been scanned and carved
+                if fd is not None:
+                    drop_cached(fd, position, chunk_size, source_map)
+        finally:
+            view.release()
+            
+    def _scan_windows(self, windows, scanner):
+        """Scan windows in this process, yielding (absolute hits, bytes scanned) per window"""
+        for buffer_start, buffer, tail_len in windows:
+            hits = [(buffer_start + buffer_pos, index) for buffer_pos, index in scanner.scan(buffer)
+                    if buffer_pos + len(scanner.groups[index][0]) > tail_len]  # Tail hits came with the previous window
+            yield hits, len(buffer) - tail_len
+            
+    def _scan_parallel(self, source_path, file_size, chunk_size, file_types=None, max_range_size=1024*1024*1024):
+        """Scan ranges in worker processes, yielding (absolute hits, bytes scanned) in source order"""
+        workers = os.cpu_count()
+        # About four ranges per worker balance the load without paying task overhead for every small chunk;
+        # capping them keeps the progress bar and carving moving on large drives
+        range_size = min(max(-(-file_size // (4 * workers)), chunk_size), max(max_range_size, chunk_size))
+        range_size = -(-range_size // chunk_size) * chunk_size
+        ranges = ((start, min(start + range_size, file_size)) for start in range(0, file_size, range_size))
+        # Every worker has its own ring with registered (pinned) buffers; share one reader's 8 x 4 MB between
+        # them, keeping two reads in flight per worker by shrinking the blocks (to no less than 64 KB)
+        reader_depth = max(2, 8 // workers)
+        reader_block_size = (8 * 4 * 1024 * 1024) // (workers * reader_depth) // mmap.PAGESIZE * mmap.PAGESIZE
+        reader_block_size = max(reader_block_size, 64 * 1024)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            def submit(start, end):
+                future = executor.submit(scan_source_range, source_path, start, end, chunk_size, file_types,
+                                         reader_depth, reader_block_size)
+                return start, end, future
+                
+            # Carving is slower than scanning, so only a few ranges run ahead of it; queuing the whole
+            # drive would keep its hits in memory until carving reached them
+            pending = deque(submit(start, end) for start, end in islice(ranges, 2 * workers))
+            while pending:
+                # Results stay in source order, carving relies on it to skip hits inside carved files
+                start, end, future = pending.popleft()
+                hits = future.result()
+                pending.extend(submit(start, end) for start, end in islice(ranges, 1))
+                yield hits, end - start
+                
+    def _carve_hits(self, source, file_size, scanned, groups, output_dir, filters):
+        """Carve signature hits from source, serializing all writes in this process"""
         recovered_count = 0
-        position = 0
-        buffer = b''
-        buffer_size = max(len(sig) + offset for sig, offset, _, _ in FILE_SIGNATURES) + 1024
+        duplicate_count = 0
+        keep = self._compile_filters(filters)
+        # End of the last carved file, used to avoid carving overlapping files
+        next_start = 0
         
         # Create progress bar
         with tqdm.tqdm(total=file_size, unit='B', unit_scale=True, desc="Scanning") as pbar:
-            while position < file_size:
-                # Read chunk
-                read_size = min(chunk_size, file_size - position)
-                chunk = file_handle.read(read_size)
-                if not chunk:
-                    break
-                    
-                # Add to buffer
-                buffer += chunk
-                if len(buffer) > buffer_size * 2:
-                    buffer = buffer[-buffer_size:]
+            for hits, scanned_size in scanned:
+                # One timestamp per window; file_pos and recovered_count keep names unique
+                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
                 
-                # Scan buffer for signatures
-                buffer_pos = 0
-                while buffer_pos < len(buffer) - 16:  # Minimum signature length
-                    found = False
-                    
-                    for signature, offset, file_type, max_size in FILE_SIGNATURES:
-                        sig_len = len(signature)
-                        if buffer_pos + sig_len <= len(buffer) and \
-                           buffer[buffer_pos:buffer_pos + sig_len] == signature:
-                            
-                            # Calculate actual file position
-                            file_pos = position - len(buffer) + buffer_pos + offset
+                for sig_pos, index in hits:
+                    for offset, file_type, max_size in groups[index][1]:
+                        # Calculate actual file position
+                        file_pos = sig_pos - offset
+                        if file_pos < next_start:
+                            continue
                             
-                            # Carve the file
-                            carved_data = self._carve_file_at_position(
-                                file_handle, file_pos, file_type, max_size, file_size)
+                        # Create unique filename
+                        file_name = f"carved_{timestamp}_{file_pos:012x}_{recovered_count:06d}{EXTENSION_MAP.get(file_type, '.bin')}"
+                        
+                        # The name is known before carving, so name filters can reject without reading anything
+                        if not keep(file_name, 0):
+                            continue
                             
-                            if carved_data:
-                                # Create unique filename
-                                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                                file_name = f"carved_{timestamp}_{file_pos:012x}_{recovered_count:06d}{EXTENSION_MAP.get(file_type, '.bin')}"
-                                
-                                # Apply filters
-                                if filters and not self._passes_filters(file_name, len(carved_data), filters):
-                                    continue
-                                    
-                                # Save file
-                                file_path = output_dir / file_name
-                                with open(file_path, 'wb') as f:
-                                    f.write(carved_data)
-                                    
-                                logging.info(f"Carved: {file_name} ({len(carved_data)} bytes)")
-                                recovered_count += 1
+                        # Carve the file
+                        carved_data = self._carve_file_at_position(
+                            source, file_pos, file_type, max_size, file_size)
+                        
+                        if carved_data:
+                            # Apply the size filter now that the size is known
+                            if not keep(file_name, len(carved_data)):
+                                continue
                                 
-                                # Skip ahead in buffer to avoid overlapping files
-                                buffer_pos += len(carved_data)
-                                found = True
+                            # Skip byte-identical copies of earlier carves
+                            file_path = output_dir / file_name
+                            if self._is_duplicate_carve(carved_data, file_path):
+                                duplicate_count += 1
+                                next_start = file_pos + len(carved_data)
                                 break
-                    
-                    if not found:
-                        buffer_pos += 1
+                                
+                            # Save file
+                            self._write_carved_file(file_path, carved_data, file_pos)
+                            
+                            logging.info(f"Carved: {file_name} ({len(carved_data)} bytes)")
+                            recovered_count += 1
+                            
+                            # Skip ahead to avoid overlapping files
+                            next_start = file_pos + len(carved_data)
+                            break
                 
                 # Update progress
-                position += read_size
-                pbar.update(read_size)
+                pbar.update(scanned_size)
                 
+        if duplicate_count:
+            logging.info(f"Skipped {duplicate_count} duplicate carved files.")
         return recovered_count
         
-    def _carve_file_at_position(self, file_handle, position, file_type, max_size, total_size):
+    def _is_duplicate_carve(self, data, file_path):
+        """Check carved data against earlier carves, hashing only when size and prefix collide"""
+        key = (len(data), bytes(data[:8]))
+        entry = self._carved_index.get(key)
+        if entry is None:
+            # First carve with this size and prefix: remember where it is saved, no hashing needed
+            self._carved_index[key] = file_path
+            return False
+            
+        if not isinstance(entry, set):
+            # The first copy may still be queued on the batched writer
+            if self._writer:
+                self._writer.flush()
+            entry = {file_content_digest(entry)}
+            self._carved_index[key] = entry
+            
+        digest = content_digest(data)
+        if digest in entry:
+            return True
+        entry.add(digest)
+        return False
+        
+    def _carve_file_at_position(self, source, position, file_type, max_size, total_size):
         """Carve a file from a specific position using appropriate method"""
         try:
-            file_handle.seek(position)
+            # Never search past the type's maximum size or the end of the source
+            limit = min(position + max_size, total_size)
             
             if file_type == 'jpg':
-                return self._carve_jpg(file_handle, max_size)
+                return self._carve_jpg(source, position, limit)
             elif file_type == 'png':
-                return self._carve_png(file_handle, max_size)
+                return self._carve_png(source, position, limit)
             elif file_type == 'pdf':
-                return self._carve_pdf(file_handle, max_size)
+                return self._carve_pdf(source, position, limit)
             elif file_type == 'mp4':
-                return self._carve_mp4(file_handle, max_size)
+                return self._carve_mp4(source, position, limit)
             elif file_type == 'avi':
-                return self._carve_avi(file_handle, max_size)
+                return self._carve_avi(source, position, limit)
             elif file_type == 'zip_based':
-                return self._carve_zip_based(file_handle, max_size)
+                return self._carve_zip_based(source, position, limit)
             elif file_type == 'cfb':
-                return self._carve_cfb(file_handle, max_size)
+                return self._carve_cfb(source, position, limit)
             else:
                 # Default carving for other file types
-                return self._carve_generic(file_handle, max_size)
+                return self._carve_generic(source, position, limit)
         except Exception as e:
             logging.warning(f"Error carving file at position {position}: {e}")
             return None
             
-    def _carve_jpg(self, file_handle, max_size):
+    def _carve_jpg(self, source, start, limit):
         """Carve JPEG file by finding EOI marker"""
-        start_pos = file_handle.tell()
-        data = file_handle.read(min(8192, max_size))
-        eoi_pos = data.find(b'\xFF\xD9')
+        eoi_pos = source.find(b'\xFF\xD9', start, limit)
         
         if eoi_pos != -1:
-            file_handle.seek(start_pos)
-            return file_handle.read(eoi_pos + 2)
+            return source[start:eoi_pos + 2]
         return None
         
-    def _carve_png(self, file_handle, max_size):
+    def _carve_png(self, source, start, limit):
         """Carve PNG file by finding IEND chunk"""
-        start_pos = file_handle.tell()
-        data = file_handle.read(min(65536, max_size))
-        iend_pos = data.find(b'IEND')
+        iend_pos = source.find(b'IEND', start, limit)
         
         if iend_pos != -1:
-            # IEND chunk is 12 bytes total (4 byte length, 4 byte type, 4 byte CRC)
-            file_handle.seek(start_pos)
-            return file_handle.read(iend_pos + 12)
+            # IEND chunk ends with the 4 byte chunk type and 4 byte CRC (its length field precedes the type)
+            return source[start:iend_pos + 8]
         return None
         
-    def _carve_pdf(self, file_handle, max_size):
+    def _carve_pdf(self, source, start, limit):
         """Carve PDF file by finding %%EOF"""
-        start_pos = file_handle.tell()
-        data = file_handle.read(min(131072, max_size))
-        eof_pos = data.find(b'%%EOF')
+        eof_pos = source.find(b'%%EOF', start, limit)
         
         if eof_pos != -1:
-            file_handle.seek(start_pos)
-            return file_handle.read(eof_pos + 5)  # %%EOF is 5 bytes
+            return source[start:eof_pos + 5]  # %%EOF is 5 bytes
         return None
         
-    def _carve_mp4(self, file_handle, max_size):
+    def _carve_mp4(self, source, start, limit):
         """Carve MP4 file by parsing box structure"""
-        start_pos = file_handle.tell()
         try:
             # Read and parse MP4 boxes to find the end
-            pos = start_pos
-            while pos < start_pos + max_size:
-                file_handle.seek(pos)
-                header = file_handle.read(8)
+            pos = start
+            while pos < limit:
+                # Read the extended size along with the header, it directly follows it
+                header = source[pos:pos + 16]
                 if len(header) < 8:
                     break
                     
-                size = struct.unpack('>I', header[0:4])[0]
+                size = int.from_bytes(header[0:4], 'big')
                 box_type = header[4:8]
                 
                 if size == 0:  # Box extends to end of file
                     break
                 if size == 1:  # Extended size
-                    extended_size = struct.unpack('>Q', file_handle.read(8))[0]
-                    pos += extended_size
+                    if len(header) < 16:
+                        return None
+                    ext_size = int.from_bytes(header[8:16], 'big')
+                    if ext_size < 16:  # Cannot even hold its own header, and 0 would never advance
+                        break
+                    pos += ext_size
+                elif size < 8:  # Not a valid box, the file ended before it
+                    break
                 else:
                     pos += size
                     
@@ -456,136 +1475,244 @@ class FileRecoveryTool:
                 if box_type == b'mdat':
                     break
                     
-            file_handle.seek(start_pos)
-            return file_handle.read(pos - start_pos)
-        except:
+            return source[start:min(pos, limit)]
+        except Exception:
             return None
             
-    def _carve_avi(self, file_handle, max_size):
-        """Carve AVI file by parsing RIFF structure"""
-        start_pos = file_handle.tell()
+    def _carve_avi(self, source, start, limit):
+        """Carve AVI file using the size of its RIFF chunk"""
         try:
-            pos = start_pos
-            while pos < start_pos + max_size:
-                file_handle.seek(pos)
-                chunk_header = file_handle.read(8)
-                if len(chunk_header) < 8:
-                    break
-                    
-                chunk_id = chunk_header[0:4]
-                chunk_size = struct.unpack('<I', chunk_header[4:8])[0]
-                
-                if chunk_id == b'RIFF' and chunk_size >= 4:
-                    # Check if it's AVI
-                    form_type = file_handle.read(4)
-                    if form_type != b'AVI ':
-                        break
-                elif chunk_id == b'LIST':
-                    # LIST chunk
-                    list_type = file_handle.read(4)
-                elif chunk_id in [b'JUNK', b'INFO']:
-                    # Skip these chunks
-                    pass
-                    
-                pos += chunk_size + 8
+            chunk_header = source[start:start + 12]
+            if len(chunk_header) < 12 or chunk_header[8:12] != b'AVI ':
+                return None
                 
-            file_handle.seek(start_pos)
-            return file_handle.read(pos - start_pos)
-        except:
+            # The RIFF chunk spans the whole file: 8 byte header plus its declared size
+            chunk_size = int.from_bytes(chunk_header[4:8], 'little')
+            return source[start:min(start + chunk_size + 8, limit)]
+        except Exception:
             return None
             
-    def _carve_zip_based(self, file_handle, max_size):
-        """Carve ZIP-based files (Office documents, archives)"""
-        start_pos = file_handle.tell()
+    def _carve_zip_based(self, source, start, limit):
+        """Carve ZIP-based files (Office documents, archives) up to their end of central directory record"""
         try:
-            # Read central directory end record
-            file_handle.seek(start_pos + max_size - 65536)  # Search near end
-            data = file_handle.read(65536)
-            eocd_pos = data.find(b'\x50\x4B\x05\x06')
-            
-            if eocd_pos != -1:
-                # Found end of central directory
-                eocd = data[eocd_pos:eocd_pos+22]
-                central_dir_size = struct.unpack('<I', eocd[12:16])[0]
-                central_dir_offset = struct.unpack('<I', eocd[16:20])[0]
-                
-                file_handle.seek(start_pos)
-                return file_handle.read(central_dir_offset + central_dir_size + 22)
-        except:
+            # Walk the EOCD markers and take the first one that really belongs to this archive
+            eocd_pos = source.find(b'\x50\x4B\x05\x06', start, limit)
+            while eocd_pos != -1:
+                eocd = source[eocd_pos:eocd_pos + 22]
+                if len(eocd) < 22:
+                    break
+                    
+                # The central directory ends exactly where the EOCD record begins
+                central_dir_size, central_dir_offset, comment_len = struct.unpack_from('<IIH', eocd, 12)
+                if central_dir_offset + central_dir_size == eocd_pos - start:
+                    return source[start:min(eocd_pos + 22 + comment_len, limit)]
+                    
+                eocd_pos = source.find(b'\x50\x4B\x05\x06', eocd_pos + 1, limit)
+        except Exception:
             pass
             
         return None
         
-    def _carve_cfb(self, file_handle, max_size):
+    def _carve_cfb(self, source, start, limit):
         """Carve Compound File Binary files"""
-        start_pos = file_handle.tell()
         try:
             # CFB files have a specific structure with sector allocation
             # This is a simplified approach
-            file_handle.seek(start_pos + 512)  # Skip header
-            data = file_handle.read(4096)
+            data = source[start + 512:start + 512 + 4096]  # Skip header
             
             # Look for typical CFB patterns
             if b'Root Entry' in data or b'\xD0\xCF\x11\xE0\xA1\xB1\x1A\xE1' in data:
-                file_handle.seek(start_pos)
-                return file_handle.read(max_size)
-        except:
+                return source[start:limit]
+        except Exception:
             pass
             
         return None
         
-    def _carve_generic(self, file_handle, max_size):
-        """Generic file carving using maximum size"""
-        start_pos = file_handle.tell()
-        return file_handle.read(max_size)
+    def _carve_generic(self, source, start, limit, block_size=1024*1024, zero_padding=64):
+        """Generic file carving using maximum size, dropping the zero run at its end"""
+        # Step back over trailing zeros block by block, so zeroed space is never copied
+        end = limit
+        while end > start:
+            block_start = max(start, end - block_size)
+            data_end = block_start + len(source[block_start:end].rstrip(b'\x00'))
+            if data_end > block_start:
+                end = data_end
+                break
+            end = block_start
+            
+        # Keep a little of the run, some formats end in zero padding
+        return source[start:min(end + zero_padding, limit)]
         
     def _recover_file(self, fs_object, output_dir, file_name, file_size):
         """Recover a single file using filesystem metadata"""
         try:
-            # Handle duplicate filenames
+            # Handle duplicate filenames: O_EXCL refuses taken names, so each attempt is a single open
+            name_parts = os.path.splitext(file_name)
             output_path = output_dir / file_name
-            counter = 1
-            while output_path.exists():
-                name_parts = os.path.splitext(file_name)
-                output_path = output_dir / f"{name_parts[0]}_{counter}{name_parts[1]}"
-                counter += 1
-                
-            # Read and save the file
-            with open(output_path, 'wb') as out_file:
+            flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+            for counter in count(1):
+                try:
+                    fd = os.open(output_path, flags, 0o644)
+                    break
+                except FileExistsError:
+                    output_path = output_dir / f"{name_parts[0]}_{counter}{name_parts[1]}"
+                    
+            # Read files up to 128MB in one call, larger ones in 16MB chunks
+            chunk_size = file_size if file_size <= 128 * 1024 * 1024 else 16 * 1024 * 1024
+            
+            # Read and save the file, writing straight to the descriptor without stdio buffering
+            try:
+                # Large files are written in several calls, reserve their space in one extent up front
+                preallocated = file_size >= self.BATCHED_WRITE_LIMIT and self._preallocate(fd, file_size)
                 offset = 0
-                remaining_size = file_size
-                
-                while remaining_size > 0:
-                    available_size = min(1024 * 1024, remaining_size)  # Read in 1MB chunks
-                    data = fs_object.read_random(offset, available_size)
+                while offset < file_size:
+                    data = fs_object.read_random(offset, min(chunk_size, file_size - offset))
                     if not data:
                         break
                         
-                    out_file.write(data)
+                    if offset == 0 and len(data) == file_size and self._queue_write(fd, data):
+                        fd = None  # The batched writer closes it
+                        break
+                    self._write_all(fd, data)
                     offset += len(data)
-                    remaining_size -= len(data)
                     
+                if preallocated and offset < file_size:
+                    # The read stopped early, drop the reserved space past the data
+                    os.ftruncate(fd, offset)
+            finally:
+                if fd is not None:
+                    os.close(fd)
+                
             return True
             
         except Exception as e:
             logging.error(f"Error recovering file {file_name}: {e}")
             return False
             
-    def _passes_filters(self, file_name, file_size, filters):
-        """Check if a file passes the provided filters"""
-        if 'extensions' in filters and filters['extensions']:
-            file_ext = os.path.splitext(file_name)[1].lower()
-            if file_ext not in filters['extensions']:
-                return False
+    def _write_carved_file(self, file_path, data, source_offset=None):
+        """Save carved data, preallocating and bypassing the page cache for large files"""
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+        
+        # Carves are slices of the source, so large ones from an image file can be copied without user space
+        if (source_offset is not None and self._copy_source is not None
+                and len(data) >= self.BATCHED_WRITE_LIMIT and hasattr(os, 'copy_file_range')):
+            try:
+                self._copy_range(file_path, self._copy_source, source_offset, len(data), flags)
+                return
+            except OSError:
+                pass  # Kernel before 4.5 or a cross-filesystem copy it refuses, write the data instead
                 
-        if 'name_substring' in filters and filters['name_substring']:
-            if filters['name_substring'].lower() not in file_name.lower():
-                return False
+        # Carved data is never read back, so large files skip the page cache (Linux only)
+        if len(data) >= self.BATCHED_WRITE_LIMIT and hasattr(os, 'O_DIRECT'):
+            try:
+                self._write_direct(file_path, data, flags | os.O_DIRECT)
+                return
+            except OSError:
+                pass  # Filesystem does not support O_DIRECT, write it buffered instead
                 
-        if 'max_size' in filters and file_size > filters['max_size']:
-            return False
+        fd = os.open(file_path, flags, 0o644)
+        try:
+            if self._queue_write(fd, data):
+                fd = None  # The batched writer closes it
+            else:
+                if len(data) >= self.BATCHED_WRITE_LIMIT:
+                    self._preallocate(fd, len(data))
+                self._write_all(fd, data)
+        finally:
+            if fd is not None:
+                os.close(fd)
             
+    def _queue_write(self, fd, data):
+        """Hand a small whole-file write to the batched writer, which then owns fd; False if it was not taken"""
+        if self._writer is None or len(data) >= self.BATCHED_WRITE_LIMIT:
+            return False
+        self._writer.write(fd, data)
         return True
+        
+    def _open_uring_writer(self):
+        """Return a batched io_uring writer, or None to write files directly"""
+        if not HAS_LIBURING:
+            return None
+        try:
+            return UringWriter()
+        except OSError as e:
+            logging.debug(f"io_uring unavailable, writing files directly: {e}")
+            return None
+            
+    def _close_writer(self):
+        """Flush and release the batched writer, if one is open"""
+        writer, self._writer = self._writer, None
+        if writer:
+            writer.close()
+            
+    def _copy_range(self, file_path, source_fd, offset, size, flags):
+        """Copy size bytes at offset of source_fd to a new file with copy_file_range (reflinked where supported)"""
+        fd = os.open(file_path, flags, 0o644)
+        try:
+            copied = 0
+            while copied < size:
+                copied_now = os.copy_file_range(source_fd, fd, size - copied, offset + copied, copied)
+                if not copied_now:
+                    raise OSError(f"copy_file_range stopped after {copied} of {size} bytes")
+                copied += copied_now
+        finally:
+            os.close(fd)
+            
+    def _write_direct(self, file_path, data, flags):
+        """Write data with O_DIRECT from a page-aligned buffer, preallocating the full size"""
+        size = len(data)
+        # O_DIRECT needs aligned addresses and lengths: anonymous maps are page aligned
+        padded_size = -(-size // mmap.PAGESIZE) * mmap.PAGESIZE
+        aligned = mmap.mmap(-1, padded_size)
+        fd = os.open(file_path, flags, 0o644)
+        try:
+            self._preallocate(fd, size)
+            aligned[:size] = data
+            self._write_all(fd, aligned)
+            # Drop the alignment padding
+            os.ftruncate(fd, size)
+        finally:
+            os.close(fd)
+            try:
+                aligned.close()
+            except BufferError:
+                pass  # The write error's traceback still references a view, the map is freed along with it
+            
+    def _preallocate(self, fd, size):
+        """Reserve size bytes for a new file so it is allocated contiguously; False if not supported"""
+        if not hasattr(os, 'posix_fallocate') or not size:
+            return False
+        try:
+            os.posix_fallocate(fd, 0, size)
+            return True
+        except OSError:
+            return False  # Filesystem without fallocate support or out of space, the write reports the latter
+            
+    def _write_all(self, fd, data):
+        """Write data to a raw file descriptor, retrying after partial writes"""
+        # Released even when os.write() raises, so an mmap passed in can still be closed
+        with memoryview(data) as view:
+            written = 0
+            while written < len(view):
+                written += os.write(fd, view[written:])
+            
+    def _compile_filters(self, filters):
+        """Build a keep(file_name, file_size) predicate for the provided filters, resolving them once per run"""
+        extensions = frozenset(filters.get('extensions') or ()) if filters else frozenset()
+        name_lc = (filters.get('name_substring') or '').lower() if filters else ''
+        max_size = filters.get('max_size') if filters else None
+        
+        def keep(file_name, file_size):
+            if extensions:
+                # Same extension as os.path.splitext(), without its overhead; a leading dot starts no extension
+                dot = file_name.rfind('.')
+                if (file_name[dot:].lower() if dot > 0 else '') not in extensions:
+                    return False
+            if name_lc and name_lc not in file_name.lower():
+                return False
+            return max_size is None or file_size <= max_size
+            
+        return keep
 
 def show_banner():
     """Display tool banner"""
@@ -614,7 +1741,8 @@ def show_help():
     
     Options:
       --no-recursive           Disable recursive directory scanning
-      --chunk-size SIZE        Chunk size in MB for carving (default: 64)
+      --chunk-size SIZE        Chunk size in MB for carving (default: auto, 64 for disks and images,
+                               16 for SATA SSDs, 4 for NVMe)
       --help                   Show this help message
     
     Examples:
@@ -660,8 +1788,7 @@ def interactive_menu():
             
             filters = {}
             if extensions:
-                filters['extensions'] = [ext.strip().lower() if ext.strip().startswith('.') else f".{ext.strip().lower()}" 
-                                       for ext in extensions.split(',')]
+                filters['extensions'] = frozenset('.' + ext.strip().lower().lstrip('.') for ext in extensions.split(','))
             if name_filter:
                 filters['name_substring'] = name_filter
             if max_size:
@@ -679,12 +1806,12 @@ def interactive_menu():
                 print("Error: Source path is required!")
                 continue
                 
-            chunk_size = input("Chunk size in MB (default 64): ").strip()
+            chunk_size = input("Chunk size in MB (default auto): ").strip()
             try:
-                chunk_size = int(chunk_size) * 1024 * 1024 if chunk_size else 64 * 1024 * 1024
+                chunk_size = int(chunk_size) * 1024 * 1024 if chunk_size else None
             except ValueError:
-                print("Invalid chunk size, using default 64MB")
-                chunk_size = 64 * 1024 * 1024
+                print("Invalid chunk size, using default")
+                chunk_size = None
             
             extensions = input("File extensions to recover (comma separated, leave empty for all): ").strip()
             name_filter = input("Filename contains (leave empty for all): ").strip()
@@ -692,8 +1819,7 @@ def interactive_menu():
             
             filters = {}
             if extensions:
-                filters['extensions'] = [ext.strip().lower() if ext.strip().startswith('.') else f".{ext.strip().lower()}" 
-                                       for ext in extensions.split(',')]
+                filters['extensions'] = frozenset('.' + ext.strip().lower().lstrip('.') for ext in extensions.split(','))
             if name_filter:
                 filters['name_substring'] = name_filter
             if max_size:
@@ -717,6 +1843,12 @@ def interactive_menu():
 
 def main():
     """Main function with CLI interface"""
+    # If no arguments provided, show interactive menu without loading argparse
+    if len(sys.argv) == 1 or sys.argv[1:] == ["--interactive"]:
+        interactive_menu()
+        return
+        
+    import argparse
     parser = argparse.ArgumentParser(description="Enhanced File Recovery Tool", add_help=False)
     parser.add_argument("source", nargs="?", help="Source drive or image path")
     parser.add_argument("-m", "--mode", choices=["deleted", "full"],
@@ -729,18 +1861,13 @@ def main():
                        help="Maximum file size in bytes")
     parser.add_argument("--no-recursive", action="store_true",
                        help="Disable recursive directory scanning")
-    parser.add_argument("--chunk-size", type=int, default=64,
-                       help="Chunk size in MB for carving (default: 64MB)")
+    parser.add_argument("--chunk-size", type=int,
+                       help="Chunk size in MB for carving (default: 64MB, less on SSDs)")
     parser.add_argument("--interactive", action="store_true",
                        help="Start interactive mode")
     parser.add_argument("--help", action="store_true",
                        help="Show help message")
     
-    # If no arguments provided, show interactive menu
-    if len(sys.argv) == 1:
-        interactive_menu()
-        return
-    
     args = parser.parse_args()
     
     if args.help:
@@ -764,8 +1891,7 @@ def main():
     # Prepare filters
     filters = {}
     if args.extensions:
-        filters['extensions'] = [ext.lower() if ext.startswith('.') else f".{ext.lower()}" 
-                               for ext in args.extensions]
+        filters['extensions'] = frozenset('.' + ext.lower().lstrip('.') for ext in args.extensions)
     if args.name:
         filters['name_substring'] = args.name
     if args.max_size:
@@ -778,7 +1904,12 @@ def main():
     if args.mode == "deleted":
         success = tool.recover_deleted_files(args.source, filters, not args.no_recursive)
     else:
-        success = tool.recover_full_drive(args.source, filters, args.chunk_size * 1024 * 1024)
+        success = tool.recover_full_drive(args.source, filters,
+                                          args.chunk_size * 1024 * 1024 if args.chunk_size else None)
+        
+    # Write out buffered log records before pointing the user at the log
+    for handler in logging.getLogger().handlers:
+        handler.flush()
         
     if success:
         print(f"Recovery completed. Files saved to: {tool.output_dir}")